@@ -16,14 +16,20 @@ PHONE_NUMBER_ID = "YOUR_PHONE_NUMBER_ID"  # Replace with your WhatsApp Business
 # Application Configuration
 MAX_RETRIES = 3  # Maximum number of retry attempts for failed messages
 RETRY_DELAY = 5  # Delay (in seconds) between retry attempts
+MAX_RETRY_AFTER = 300  # Longest delay (in seconds) honored from a Retry-After header
 RATE_LIMIT = 20  # Maximum messages per minute (adjust according to your WhatsApp Business API limits)
+CACHE_TTL = 300  # Time (in seconds) a successful send is remembered to skip duplicate sends
+CACHE_MAX_ENTRIES = 10000  # Maximum number of remembered sends
+SEND_QUEUE_SIZE = 1024  # Maximum contacts read ahead of the senders during a bulk send
 
 # Logging Configuration
 LOG_FILE = "app.log"
-LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_FORMAT = "{asctime} - {levelname} - {message}"  # str.format-style fields
 LOG_LEVEL = "INFO"
 
 # File Upload Configuration
 ALLOWED_IMAGE_TYPES = [".jpg", ".jpeg", ".png"]
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB in bytes
-CONTACTS_FILE_TYPE = ".csv"
\ No newline at end of file
+CONTACTS_FILE_TYPE = ".csv"
+CONTACTS_CHUNK_SIZE = 50000  # Rows parsed per chunk when loading contacts
+CONTACTS_STREAM_CHUNK_SIZE = 1000  # Rows parsed per chunk when sending straight from a file
\ No newline at end of file
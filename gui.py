@@ -6,30 +6,77 @@ It provides an interface for uploading contacts, customizing messages, and monit
 """
 
 import sys
-import csv
 import os
-from typing import List, Dict
+import asyncio
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Union
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QFileDialog, QTableWidget,
-    QTableWidgetItem, QProgressBar, QMessageBox, QScrollArea,
+    QPushButton, QLabel, QTextEdit, QFileDialog, QTableView,
+    QProgressBar, QMessageBox, QScrollArea,
     QPlainTextEdit, QFrame, QHeaderView
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QSize, QAbstractTableModel, QModelIndex, QTimer,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import QFont, QIcon, QPixmap, QImage
 from whatsapp_api import WhatsAppAPI
-from logger import setup_logger, get_qt_handler
-from config import ALLOWED_IMAGE_TYPES, MAX_IMAGE_SIZE
+from logger import setup_logger, get_qt_handler, stop_logging
+from config import (
+    ALLOWED_IMAGE_TYPES,
+    MAX_IMAGE_SIZE,
+    CONTACTS_CHUNK_SIZE,
+    CONTACTS_STREAM_CHUNK_SIZE
+)
 
 # Initialize logger
 logger = setup_logger()
 
+def _read_contact_chunks(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a contacts CSV file in chunks with validated phone numbers.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        chunksize (int): Number of rows parsed per chunk
+        
+    Yields:
+        pd.DataFrame: Contacts with valid, digits-only phone numbers
+    """
+    skipped = 0
+    for chunk in pd.read_csv(
+        file_path,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize
+    ):
+        if 'phone_number' not in chunk.columns:
+            raise ValueError("CSV file has no 'phone_number' column")
+
+        # Normalize and validate phone numbers for the whole chunk at once
+        phones = chunk['phone_number'].str.replace(r"\D", "", regex=True)
+        valid = phones.str.len().between(10, 15)
+        chunk['phone_number'] = phones
+        skipped += int((~valid).sum())
+        yield chunk[valid]
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} contacts with invalid phone numbers")
+
+def _stream_contacts(file_path: str) -> Iterator[Dict]:
+    """Yield contacts from a CSV file without loading the whole file."""
+    for chunk in _read_contact_chunks(file_path, CONTACTS_STREAM_CHUNK_SIZE):
+        yield from chunk.to_dict(orient="records")
+
 class SendMessagesWorker(QThread):
     """Worker thread for sending bulk messages."""
     progress = pyqtSignal(float, dict)
     finished = pyqtSignal(dict)
 
-    def __init__(self, api: WhatsAppAPI, contacts: List[Dict], 
+    def __init__(self, api: WhatsAppAPI,
+                 contacts: Union[pd.DataFrame, Iterable[Dict]],
                  message_template: str, image_url: str = None):
         super().__init__()
         self.api = api
@@ -39,28 +86,125 @@ class SendMessagesWorker(QThread):
 
     def run(self):
         """Execute the bulk message sending operation."""
-        results = self.api.send_bulk_messages(
+        results = asyncio.run(self.api.send_bulk_messages_async(
             self.contacts,
             self.message_template,
             self.image_url,
             self.progress.emit
-        )
+        ))
         self.finished.emit(results)
 
+@lru_cache(maxsize=16)
+def _scaled_image(path: str, mtime: float, width: int, height: int) -> QImage:
+    """Decode and scale an image; mtime is part of the key so edited files reload."""
+    return QImage(path).scaled(
+        width,
+        height,
+        Qt.KeepAspectRatio,
+        Qt.SmoothTransformation
+    )
+
+class ImageLoaderSignals(QObject):
+    """Signals emitted by ImageLoader."""
+    loaded = pyqtSignal(str, QImage)
+
+class ImageLoader(QRunnable):
+    """Background task that decodes and scales an image for preview."""
+
+    def __init__(self, path: str, size: QSize):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = ImageLoaderSignals()
+
+    def run(self):
+        """Load the scaled image and hand it back to the GUI thread."""
+        # Exceptions must not escape QRunnable.run; a null image is reported
+        # by the GUI instead
+        try:
+            image = _scaled_image(
+                self.path,
+                os.path.getmtime(self.path),
+                self.size.width(),
+                self.size.height()
+            )
+        except OSError:
+            image = QImage()
+        self.signals.loaded.emit(self.path, image)
+
+class ContactsModel(QAbstractTableModel):
+    """Table model exposing loaded contacts to a QTableView on demand."""
+    COLUMNS = [
+        ("name", "Name"),
+        ("phone_number", "Phone Number"),
+        ("custom_field", "Custom Field")
+    ]
+
+    def __init__(self, contacts_df: pd.DataFrame = None, parent=None):
+        super().__init__(parent)
+        self._columns = []
+        self._row_count = 0
+        if contacts_df is not None:
+            self._load_columns(contacts_df)
+
+    def _load_columns(self, contacts_df: pd.DataFrame):
+        """Keep one list per displayed column; missing columns show as empty."""
+        self._columns = [
+            contacts_df[key].tolist() if key in contacts_df.columns else None
+            for key, _ in self.COLUMNS
+        ]
+        self._row_count = len(contacts_df)
+
+    def set_contacts(self, contacts_df: pd.DataFrame):
+        """Replace the displayed contacts."""
+        self.beginResetModel()
+        self._load_columns(contacts_df)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return the number of contacts."""
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return the number of displayed contact fields."""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the field value for a visible cell."""
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        column = self._columns[index.column()]
+        if column is None:
+            return ''
+        return column[index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return column titles for the horizontal header."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
     def __init__(self):
         super().__init__()
         self.api = WhatsAppAPI()
-        self.contacts = []
+        self.contacts_df = pd.DataFrame()
         self.image_path = None
         self.setup_ui()
         
-        # Connect logger to GUI
-        qt_handler = get_qt_handler()
-        if qt_handler:
-            qt_handler.new_log.connect(self.append_log)
+        # Connect logger to GUI, flushing buffered records in batches
+        self.qt_handler = get_qt_handler()
+        if self.qt_handler:
+            self.log_timer = QTimer(self)
+            self.log_timer.setInterval(100)
+            self.log_timer.timeout.connect(self._flush_logs)
+            self.log_timer.start()
 
     def setup_ui(self):
         """Set up the user interface."""
@@ -95,8 +239,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(header)
         
         # Contacts table
-        self.contacts_table = QTableWidget(0, 3)
-        self.contacts_table.setHorizontalHeaderLabels(["Name", "Phone Number", "Custom Field"])
+        self.contacts_model = ContactsModel(self.contacts_df)
+        self.contacts_table = QTableView()
+        self.contacts_table.setModel(self.contacts_model)
         self.contacts_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.contacts_table)
         
@@ -106,6 +251,10 @@ class MainWindow(QMainWindow):
         load_btn.clicked.connect(self.load_contacts)
         controls.addWidget(load_btn)
         
+        stream_btn = QPushButton("Load && Send (CSV)")
+        stream_btn.clicked.connect(self.load_and_send)
+        controls.addWidget(stream_btn)
+        
         clear_btn = QPushButton("Clear Contacts")
         clear_btn.clicked.connect(self.clear_contacts)
         controls.addWidget(clear_btn)
@@ -176,6 +325,7 @@ class MainWindow(QMainWindow):
         
         self.log_viewer = QPlainTextEdit()
         self.log_viewer.setReadOnly(True)
+        self.log_viewer.setMaximumBlockCount(5000)
         layout.addWidget(self.log_viewer)
         
         return panel
@@ -201,7 +351,7 @@ class MainWindow(QMainWindow):
             QPushButton:hover {
                 background-color: #0056b3;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #ddd;
                 border-radius: 5px;
             }
@@ -233,12 +383,14 @@ class MainWindow(QMainWindow):
             return
             
         try:
-            with open(file_path, 'r') as file:
-                reader = csv.DictReader(file)
-                self.contacts = list(reader)
+            # Parse in chunks so large files are not built in one allocation
+            chunks = list(_read_contact_chunks(file_path, CONTACTS_CHUNK_SIZE))
+            self.contacts_df = (
+                pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+            )
                 
             self.update_contacts_table()
-            logger.info(f"Loaded {len(self.contacts)} contacts from {file_path}")
+            logger.info(f"Loaded {len(self.contacts_df)} contacts from {file_path}")
             
         except Exception as e:
             QMessageBox.critical(
@@ -250,16 +402,12 @@ class MainWindow(QMainWindow):
 
     def update_contacts_table(self):
         """Update the contacts table with loaded data."""
-        self.contacts_table.setRowCount(len(self.contacts))
-        for i, contact in enumerate(self.contacts):
-            self.contacts_table.setItem(i, 0, QTableWidgetItem(contact.get('name', '')))
-            self.contacts_table.setItem(i, 1, QTableWidgetItem(contact.get('phone_number', '')))
-            self.contacts_table.setItem(i, 2, QTableWidgetItem(contact.get('custom_field', '')))
+        self.contacts_model.set_contacts(self.contacts_df)
 
     def clear_contacts(self):
         """Clear all loaded contacts."""
-        self.contacts = []
-        self.contacts_table.setRowCount(0)
+        self.contacts_df = pd.DataFrame()
+        self.contacts_model.set_contacts(self.contacts_df)
         logger.info("Contacts cleared")
 
     def upload_image(self):
@@ -283,20 +431,26 @@ class MainWindow(QMainWindow):
             )
             return
             
-        # Update preview
-        pixmap = QPixmap(file_path)
-        scaled_pixmap = pixmap.scaled(
-            self.image_preview.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        self.image_preview.setPixmap(scaled_pixmap)
+        # Decode the preview off the GUI thread
         self.image_path = file_path
+        self._image_loader = ImageLoader(file_path, self.image_preview.size())
+        self._image_loader.signals.loaded.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(self._image_loader)
         logger.info(f"Image uploaded: {file_path}")
 
+    def _on_image_loaded(self, path: str, image: QImage):
+        """Show a decoded image preview."""
+        # Ignore previews for images that have since been replaced
+        if path != self.image_path:
+            return
+        if image.isNull():
+            logger.warning(f"Could not decode image preview: {path}")
+            return
+        self.image_preview.setPixmap(QPixmap.fromImage(image))
+
     def send_messages(self):
         """Initiate the bulk message sending operation."""
-        if not self.contacts:
+        if self.contacts_df.empty:
             QMessageBox.warning(
                 self,
                 "Warning",
@@ -304,18 +458,48 @@ class MainWindow(QMainWindow):
             )
             return
             
+        if not self._check_message_template():
+            return
+            
+        self.progress_bar.setRange(0, 100)
+        self._start_sending(self.contacts_df)
+
+    def load_and_send(self):
+        """Send messages while contacts are still being read from a CSV file."""
+        if not self._check_message_template():
+            return
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Load & Send Contacts",
+            "",
+            "CSV Files (*.csv)"
+        )
+        
+        if not file_path:
+            return
+
+        # The total is unknown until the whole file is read
+        self.progress_bar.setRange(0, 0)
+        self._start_sending(_stream_contacts(file_path))
+
+    def _check_message_template(self) -> bool:
+        """Warn and return False if no message template was entered."""
         if not self.message_edit.toPlainText().strip():
             QMessageBox.warning(
                 self,
                 "Warning",
                 "Please enter a message template"
             )
-            return
-            
+            return False
+        return True
+
+    def _start_sending(self, contacts: Union[pd.DataFrame, Iterable[Dict]]):
+        """Start a worker thread sending messages to the given contacts."""
         # Create and start worker thread
         self.worker = SendMessagesWorker(
             self.api,
-            self.contacts,
+            contacts,
             self.message_edit.toPlainText(),
             self.image_path
         )
@@ -334,11 +518,23 @@ class MainWindow(QMainWindow):
         """Handle completion of message sending operation."""
         self.progress_bar.setVisible(False)
         
-        message = (
-            f"Message sending completed:\n"
+        summary = (
             f"Successful: {results['successful']}\n"
             f"Failed: {results['failed']}"
         )
+
+        # Reading the contacts stopped early, e.g. a malformed CSV file
+        if "error" in results:
+            message = f"Message sending stopped:\n{results['error']}\n{summary}"
+            QMessageBox.critical(
+                self,
+                "Error",
+                message
+            )
+            logger.error(message)
+            return
+
+        message = f"Message sending completed:\n{summary}"
         
         QMessageBox.information(
             self,
@@ -350,6 +546,12 @@ class MainWindow(QMainWindow):
     def append_log(self, message: str):
         """Append a message to the log viewer."""
         self.log_viewer.appendPlainText(message)
+
+    def _flush_logs(self):
+        """Append all buffered log messages to the log viewer at once."""
+        messages = self.qt_handler.drain()
+        if messages:
+            self.append_log("\n".join(messages))
         
     def closeEvent(self, event):
         """Handle application closure."""
@@ -364,8 +566,12 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.Yes:
                 self.worker.terminate()
+                self.api.close()
+                stop_logging()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.api.close()
+            stop_logging()
             event.accept()
\ No newline at end of file
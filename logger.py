@@ -5,48 +5,111 @@ This module sets up a centralized logging system for the WhatsApp Business API i
 It provides both file and console logging, with the ability to stream logs to the GUI.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from PyQt5.QtCore import QObject, pyqtSignal
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from logging.handlers import (
+    RotatingFileHandler, QueueHandler, QueueListener
+)
 from config import LOG_FILE, LOG_FORMAT, LOG_LEVEL
 
-class QtHandler(QObject, logging.Handler):
-    """Custom logging handler that emits Qt signals for GUI integration."""
-    new_log = pyqtSignal(str)
+# Background listener that writes queued records to the real handlers
+_listener = None
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter using str.format-style fields that reuses the formatted
+    timestamp for all records logged within the same second.
+    """
+
+    def __init__(self, fmt=LOG_FORMAT, datefmt=None):
+        super().__init__(fmt, datefmt, style="{")
+        self._cached_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, calling strftime at most once per second."""
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(
+                datefmt or self.default_time_format,
+                self.converter(record.created)
+            )
+            self._cached_time = (second, formatted)
+
+        if datefmt:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+class QtHandler(logging.Handler):
+    """
+    Custom logging handler that buffers log messages for GUI integration.
+    
+    Records are collected in a thread-safe buffer and drained periodically
+    by the GUI, so heavy logging does not repaint the log viewer per record.
+    """
 
     def __init__(self):
         super().__init__()
-        QObject.__init__(self)
-        logging.Handler.__init__(self)
-        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.setFormatter(CachedTimeFormatter())
+        # Bounded so messages do not pile up when no window is draining them
+        self._buf = deque(maxlen=5000)
+        self._buf_lock = threading.Lock()
 
     def emit(self, record):
-        """Emit a log message as a Qt signal."""
+        """Buffer a formatted log message for the GUI."""
         msg = self.format(record)
-        self.new_log.emit(msg)
+        with self._buf_lock:
+            self._buf.append(msg)
+
+    def drain(self):
+        """
+        Take all buffered log messages.
+        
+        Returns:
+            list: Messages logged since the previous drain, oldest first
+        """
+        with self._buf_lock:
+            messages = list(self._buf)
+            self._buf.clear()
+        return messages
 
 def setup_logger(name="whatsapp_messenger"):
     """
     Set up and configure the logger with console, file, and Qt handlers.
     
+    Records are put on a queue and written to the handlers by a background
+    QueueListener thread, keeping disk I/O off the calling thread. The
+    logger is configured on the first call; later calls return it as is.
+    
     Args:
         name (str): The name of the logger instance
         
     Returns:
         logging.Logger: Configured logger instance
     """
+    # Pass the name positionally so every call shares one cache entry
+    return _configure_logger(name)
+
+@lru_cache(maxsize=None)
+def _configure_logger(name):
+    """Configure the named logger once; see setup_logger."""
+    global _listener
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, LOG_LEVEL))
 
-    # Prevent duplicate handlers
-    if logger.handlers:
-        return logger
+    # One formatter shared by all handlers so they share its time cache
+    formatter = CachedTimeFormatter()
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
 
     # File Handler (with rotation)
     file_handler = RotatingFileHandler(
@@ -54,15 +117,34 @@ def setup_logger(name="whatsapp_messenger"):
         maxBytes=1024 * 1024,  # 1MB
         backupCount=5
     )
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(formatter)
 
     # Qt Handler for GUI integration
     qt_handler = QtHandler()
-    logger.addHandler(qt_handler)
+    qt_handler.setFormatter(formatter)
+
+    # Hand records to a background thread instead of writing them inline
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        qt_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
+def stop_logging():
+    """Flush queued log records and stop the background listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 def get_qt_handler():
     """
     Get the Qt handler instance from the logger.
@@ -70,8 +152,9 @@ def get_qt_handler():
     Returns:
         QtHandler: The Qt handler instance for GUI integration
     """
-    logger = logging.getLogger("whatsapp_messenger")
-    for handler in logger.handlers:
+    if _listener is None:
+        return None
+    for handler in _listener.handlers:
         if isinstance(handler, QtHandler):
             return handler
     return None
@@ -6,9 +6,19 @@ including sending messages, handling errors, and managing rate limits.
 """
 
 import time
+import asyncio
+import hashlib
+import math
+import random
+import string
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+import aiohttp
 import requests
-import json
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+import orjson
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Union
 from urllib.parse import urljoin
 import logging
 from config import (
@@ -17,13 +27,114 @@ from config import (
     PHONE_NUMBER_ID,
     MAX_RETRIES,
     RETRY_DELAY,
-    RATE_LIMIT
+    MAX_RETRY_AFTER,
+    RATE_LIMIT,
+    CACHE_TTL,
+    CACHE_MAX_ENTRIES,
+    SEND_QUEUE_SIZE
 )
 from logger import setup_logger
 
+if TYPE_CHECKING:
+    import pandas
+
 # Initialize logger
 logger = setup_logger()
 
+_formatter = string.Formatter()
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Optional[tuple]:
+    """
+    Parse a message template once into (literal, field_name) pairs.
+    
+    Returns None if the template uses conversions, format specs or
+    attribute/index lookups, which are left to str.format_map.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in _formatter.parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+def _render(template: str, contact: Dict) -> str:
+    """Render a message template for a contact."""
+    parts = _compile_template(template)
+    if parts is None:
+        return template.format_map(contact)
+    return "".join(
+        literal + str(contact[field_name]) if field_name is not None else literal
+        for literal, field_name in parts
+    )
+
+def _iter_contacts(contacts) -> Iterator[Dict]:
+    """Yield contacts as dicts from a list of dicts or a pandas DataFrame."""
+    if hasattr(contacts, "itertuples"):
+        columns = list(contacts.columns)
+        for row in contacts.itertuples(index=False, name=None):
+            yield dict(zip(columns, row))
+    else:
+        yield from contacts
+
+def _parse_response_body(body: bytes) -> Dict:
+    """
+    Parse the body of a successful (HTTP 200) API response.
+    
+    The message has already been accepted at this point, so a body that is
+    not valid JSON is kept as raw text rather than treated as a failure,
+    which would resend the message.
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        logger.warning("Received a non-JSON body for a successful send")
+        return {"raw": body.decode(errors="replace")}
+
+# Placeholder recipient spliced into serialized payload templates
+_TO_PLACEHOLDER = b'"to":"__TO__"'
+
+def _payload(
+    phone_number: str,
+    message: Optional[str],
+    image_url: Optional[str]
+) -> Dict:
+    """Build the API request payload for a single message."""
+    payload = {
+        "messaging_product": "whatsapp",
+        "recipient_type": "individual",
+        "to": phone_number,
+        "type": "text",
+        "text": {"body": message}
+    }
+
+    # If image URL is provided, send the image instead of the text
+    if image_url:
+        payload = {
+            "messaging_product": "whatsapp",
+            "recipient_type": "individual",
+            "to": phone_number,
+            "type": "image",
+            "image": {"url": image_url}
+        }
+    return payload
+
+@lru_cache(maxsize=64)
+def _static_payload_template(message: Optional[str], image_url: Optional[str]) -> bytes:
+    """
+    Serialize a message payload once, with a placeholder recipient.
+    
+    Args:
+        message (str, optional): Message content; None for image messages
+        image_url (str, optional): URL of image to send
+        
+    Returns:
+        bytes: JSON payload containing _TO_PLACEHOLDER
+    """
+    return orjson.dumps(_payload("__TO__", message, image_url))
+
 class WhatsAppAPI:
     def __init__(self):
         """Initialize WhatsApp API client with configuration settings."""
@@ -34,37 +145,176 @@ class WhatsAppAPI:
             "Authorization": f"Bearer {self.auth_token}",
             "Content-Type": "application/json"
         }
-        self.message_count = 0
-        self.last_reset_time = time.time()
+        # Token bucket refilled at RATE_LIMIT tokens per minute
+        self._tokens = float(RATE_LIMIT)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        # Successful sends in insertion (and so sending-time) order
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Persistent session so connections are kept alive between messages
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(RATE_LIMIT, 16),
+            max_retries=0
+        )
+        self.session.mount("https://", adapter)
 
-    def _check_rate_limit(self) -> bool:
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _acquire_token(self) -> float:
         """
-        Check if current message rate is within limits.
+        Take a token from the rate-limit bucket.
+        
+        When the bucket is empty the token is borrowed against the next
+        refill, so concurrent callers queue up in order.
         
         Returns:
-            bool: True if within rate limit, False otherwise
+            float: Seconds to wait before sending (0 if a token was available)
         """
-        current_time = time.time()
-        if current_time - self.last_reset_time >= 60:
-            self.message_count = 0
-            self.last_reset_time = current_time
-        
-        if self.message_count >= RATE_LIMIT:
-            logger.warning("Rate limit reached. Waiting before sending more messages.")
-            return False
-        return True
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(RATE_LIMIT),
+                self._tokens + (now - self._last_refill) * RATE_LIMIT / 60.0
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * 60.0 / RATE_LIMIT
 
     def _wait_for_rate_limit(self):
-        """Wait until rate limit reset."""
-        while not self._check_rate_limit():
-            time.sleep(1)
+        """Wait until a message may be sent within the rate limit."""
+        delay = self._acquire_token()
+        if delay > 0:
+            logger.warning(f"Rate limit reached. Waiting {delay:.1f}s before sending.")
+            time.sleep(delay)
 
-    def send_message(
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute how long to wait before retrying a failed send.
+        
+        Uses exponential backoff with random jitter so concurrent senders do
+        not retry in lockstep, unless the API supplied a Retry-After delay,
+        which is clamped to [0, MAX_RETRY_AFTER].
+        
+        Args:
+            attempt (int): Zero-based number of the attempt that failed
+            retry_after (str, optional): Retry-After response header value
+            
+        Returns:
+            float: Delay in seconds
+        """
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                # HTTP-date form is not supported; fall back to backoff
+                delay = None
+            if delay is not None and math.isfinite(delay):
+                return min(max(delay, 0.0), MAX_RETRY_AFTER)
+        return RETRY_DELAY * 2 ** attempt + random.uniform(0, RETRY_DELAY)
+
+    def _build_payload(
         self,
         phone_number: str,
         message: str,
         image_url: Optional[str] = None,
-        retry_count: int = 0
+        shared_message: bool = False
+    ) -> bytes:
+        """
+        Build the serialized API request payload for a single message.
+        
+        Args:
+            phone_number (str): Recipient's phone number
+            message (str): Message content
+            image_url (str, optional): URL of image to send
+            shared_message (bool): True if the same message goes to every
+                recipient of a bulk send
+            
+        Returns:
+            bytes: JSON request payload
+        """
+        # Personalized text differs per recipient, so serialize it directly
+        if not image_url and not shared_message:
+            return orjson.dumps(_payload(phone_number, message, image_url))
+
+        # Reuse the cached serialization and only splice in the recipient.
+        # Image payloads do not contain the message, so it is left out of
+        # the cache key. "to" precedes the message body, so the first match
+        # is the recipient.
+        template = _static_payload_template(
+            None if image_url else message,
+            image_url
+        )
+        recipient = b'"to":' + orjson.dumps(phone_number)
+        return template.replace(_TO_PLACEHOLDER, recipient, 1)
+
+    def _cache_key(
+        self,
+        phone_number: str,
+        message: str,
+        image_url: Optional[str] = None
+    ) -> str:
+        """Build the response cache key for a message."""
+        return hashlib.sha1(
+            f"{phone_number}|{message}|{image_url}".encode()
+        ).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[Dict]:
+        """
+        Look up a successful response sent within the last CACHE_TTL seconds.
+        
+        Args:
+            key (str): Cache key from _cache_key
+            
+        Returns:
+            dict: Cached API response, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+
+            sent_at, response = entry
+            if time.time() - sent_at >= CACHE_TTL:
+                del self._response_cache[key]
+                return None
+            return response
+
+    def _store_response(self, key: str, response: Dict):
+        """
+        Remember a successful response, evicting expired and excess entries.
+        
+        Args:
+            key (str): Cache key from _cache_key
+            response (dict): API response to remember
+        """
+        with self._cache_lock:
+            now = time.time()
+            self._response_cache[key] = (now, response)
+            self._response_cache.move_to_end(key)
+
+            # Oldest entries are at the front; drop them until the rest are
+            # fresh and within the size limit
+            while self._response_cache:
+                sent_at, _ = next(iter(self._response_cache.values()))
+                if (now - sent_at < CACHE_TTL
+                        and len(self._response_cache) <= CACHE_MAX_ENTRIES):
+                    break
+                self._response_cache.popitem(last=False)
+
+    def send_message(
+        self,
+        phone_number: str,
+        message: str,
+        image_url: Optional[str] = None
     ) -> Dict:
         """
         Send a message to a specific phone number via WhatsApp Business API.
@@ -73,102 +323,236 @@ class WhatsAppAPI:
             phone_number (str): Recipient's phone number
             message (str): Message content
             image_url (str, optional): URL of image to send
-            retry_count (int): Current retry attempt number
             
         Returns:
             dict: API response
         """
-        self._wait_for_rate_limit()
+        cache_key = self._cache_key(phone_number, message, image_url)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info(f"Message already sent to {phone_number}, skipping duplicate")
+            return cached
 
-        try:
-            endpoint = f"{self.base_url}/{self.phone_number_id}/messages"
-            
-            # Prepare message payload
-            payload = {
-                "messaging_product": "whatsapp",
-                "recipient_type": "individual",
-                "to": phone_number,
-                "type": "text",
-                "text": {"body": message}
-            }
-
-            # If image URL is provided, modify payload to include image
-            if image_url:
-                payload = {
-                    "messaging_product": "whatsapp",
-                    "recipient_type": "individual",
-                    "to": phone_number,
-                    "type": "image",
-                    "image": {"url": image_url}
-                }
-
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload
-            )
+        endpoint = f"{self.base_url}/{self.phone_number_id}/messages"
+        payload = self._build_payload(phone_number, message, image_url)
+        error = {}
 
-            if response.status_code == 200:
-                self.message_count += 1
-                logger.info(f"Message sent successfully to {phone_number}")
-                return response.json()
-            
-            error_msg = f"Failed to send message to {phone_number}. Status: {response.status_code}"
-            if retry_count < MAX_RETRIES:
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_rate_limit()
+            retry_after = None
+            try:
+                response = self.session.post(
+                    endpoint,
+                    data=payload,
+                    timeout=(3.05, 27)
+                )
+
+                if response.status_code == 200:
+                    logger.info(f"Message sent successfully to {phone_number}")
+                    result = _parse_response_body(response.content)
+                    self._store_response(cache_key, result)
+                    return result
+
+                error_msg = f"Failed to send message to {phone_number}. Status: {response.status_code}"
+                error = {"error": error_msg, "status_code": response.status_code}
+                retry_after = response.headers.get("Retry-After")
+
+            except requests.RequestException as e:
+                error_msg = f"Network error while sending message to {phone_number}: {str(e)}"
+                error = {"error": error_msg}
+
+            if attempt < MAX_RETRIES:
                 logger.warning(f"{error_msg} Retrying...")
-                time.sleep(RETRY_DELAY)
-                return self.send_message(phone_number, message, image_url, retry_count + 1)
+                time.sleep(self._retry_delay(attempt, retry_after))
+
+        logger.error(f"{error_msg} Max retries reached.")
+        return error
+
+    async def _wait_for_rate_limit_async(self):
+        """Wait for the rate limit without blocking the event loop."""
+        delay = self._acquire_token()
+        if delay > 0:
+            logger.warning(f"Rate limit reached. Waiting {delay:.1f}s before sending.")
+            await asyncio.sleep(delay)
+
+    async def _send_message_async(
+        self,
+        session: aiohttp.ClientSession,
+        phone_number: str,
+        message: str,
+        image_url: Optional[str] = None,
+        shared_message: bool = False
+    ) -> Dict:
+        """
+        Send a message using a shared aiohttp session.
+        
+        Args:
+            session (aiohttp.ClientSession): Session shared by the bulk send
+            phone_number (str): Recipient's phone number
+            message (str): Message content
+            image_url (str, optional): URL of image to send
+            shared_message (bool): True if the same message goes to every
+                recipient of the bulk send
             
-            logger.error(f"{error_msg} Max retries reached.")
-            return {"error": error_msg, "status_code": response.status_code}
+        Returns:
+            dict: API response
+        """
+        cache_key = self._cache_key(phone_number, message, image_url)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            logger.info(f"Message already sent to {phone_number}, skipping duplicate")
+            return cached
+
+        endpoint = f"{self.base_url}/{self.phone_number_id}/messages"
+        payload = self._build_payload(
+            phone_number,
+            message,
+            image_url,
+            shared_message
+        )
+        error = {}
+
+        for attempt in range(MAX_RETRIES + 1):
+            await self._wait_for_rate_limit_async()
+            retry_after = None
+            try:
+                async with session.post(
+                    endpoint,
+                    data=payload,
+                    headers=self.headers
+                ) as response:
+                    if response.status == 200:
+                        logger.info(f"Message sent successfully to {phone_number}")
+                        result = _parse_response_body(await response.read())
+                        self._store_response(cache_key, result)
+                        return result
+
+                    error_msg = f"Failed to send message to {phone_number}. Status: {response.status}"
+                    error = {"error": error_msg, "status_code": response.status}
+                    retry_after = response.headers.get("Retry-After")
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error_msg = f"Network error while sending message to {phone_number}: {str(e)}"
+                error = {"error": error_msg}
 
-        except requests.RequestException as e:
-            error_msg = f"Network error while sending message to {phone_number}: {str(e)}"
-            if retry_count < MAX_RETRIES:
+            if attempt < MAX_RETRIES:
                 logger.warning(f"{error_msg} Retrying...")
-                time.sleep(RETRY_DELAY)
-                return self.send_message(phone_number, message, image_url, retry_count + 1)
-            
-            logger.error(f"{error_msg} Max retries reached.")
-            return {"error": error_msg}
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
 
-    def send_bulk_messages(
+        logger.error(f"{error_msg} Max retries reached.")
+        return error
+
+    async def send_bulk_messages_async(
         self,
-        contacts: List[Dict],
+        contacts: Union[Iterable[Dict], "pandas.DataFrame"],
         message_template: str,
         image_url: Optional[str] = None,
         callback=None
     ) -> Dict:
         """
-        Send customized messages to multiple contacts.
+        Send customized messages to multiple contacts concurrently.
+        
+        Contacts are read on a separate thread into a bounded queue while
+        up to RATE_LIMIT requests are kept in flight over a single aiohttp
+        session, so reading and sending overlap and connections are reused
+        across the whole batch.
         
         Args:
-            contacts (List[Dict]): List of contact dictionaries with details
+            contacts (Iterable[Dict] or DataFrame): Contact dictionaries (a
+                list or any iterator, e.g. a stream from a CSV file), or a
+                DataFrame with one column per contact field
             message_template (str): Message template with placeholders
             image_url (str, optional): URL of image to send
             callback (callable, optional): Callback function for progress updates
             
         Returns:
-            dict: Summary of sending operation
+            dict: Summary of sending operation, with an "error" entry if
+                reading the contacts failed part way through
         """
+        # Sized inputs report their total up front; streams count as they go
+        total_known = hasattr(contacts, "__len__")
         results = {
-            "total": len(contacts),
+            "total": len(contacts) if total_known else 0,
             "successful": 0,
             "failed": 0,
             "failures": []
         }
+        done = 0
+        last_progress = -1
+
+        # Templates without placeholders render to the same message for everyone
+        if "{" not in message_template and "}" not in message_template:
+            static_message = message_template
+        else:
+            static_message = None
+
+        loop = asyncio.get_running_loop()
+        pending = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
 
-        for index, contact in enumerate(contacts):
+        async def enqueue(contact):
+            if not total_known and contact is not None:
+                results["total"] += 1
+            await pending.put(contact)
+
+        async def skip_duplicate():
+            if total_known:
+                results["total"] -= 1
+
+        async def record_read_error(error_msg):
+            results["error"] = error_msg
+
+        def produce():
+            # Runs in its own thread so reading contacts (e.g. parsing a CSV)
+            # overlaps with sending; the bounded queue caps memory use.
+            seen = set()
+            duplicates = 0
+            try:
+                for contact in _iter_contacts(contacts):
+                    # Send at most one message per phone number
+                    phone_number = contact.get('phone_number')
+                    if phone_number is not None:
+                        if phone_number in seen:
+                            duplicates += 1
+                            asyncio.run_coroutine_threadsafe(skip_duplicate(), loop).result()
+                            continue
+                        seen.add(phone_number)
+                    asyncio.run_coroutine_threadsafe(enqueue(contact), loop).result()
+            except Exception as e:
+                error_msg = f"Error reading contacts: {str(e)}"
+                logger.error(error_msg)
+                asyncio.run_coroutine_threadsafe(
+                    record_read_error(error_msg), loop
+                ).result()
+            finally:
+                if duplicates:
+                    logger.info(f"Skipped {duplicates} contacts with duplicate phone numbers")
+                for _ in range(RATE_LIMIT):
+                    asyncio.run_coroutine_threadsafe(enqueue(None), loop).result()
+
+        async def process(session, contact):
             try:
                 # Customize message for this contact
-                custom_message = message_template.format(**contact)
-                
-                # Send message
-                response = self.send_message(
+                custom_message = static_message
+                if custom_message is None:
+                    custom_message = _render(message_template, contact)
+                return await self._send_message_async(
+                    session,
                     phone_number=contact['phone_number'],
                     message=custom_message,
-                    image_url=image_url
+                    image_url=image_url,
+                    shared_message=static_message is not None
                 )
+            except Exception as e:
+                logger.error(f"Error processing contact {contact}: {str(e)}")
+                return {"error": str(e)}
+
+        async def send_worker(session):
+            nonlocal done, last_progress
+            while True:
+                contact = await pending.get()
+                if contact is None:
+                    return
+                response = await process(session, contact)
 
                 # Update results
                 if "error" not in response:
@@ -180,24 +564,68 @@ class WhatsAppAPI:
                         "error": response["error"]
                     })
 
-                # Progress callback
+                # Progress callback, only when the whole percentage changes
+                done += 1
                 if callback:
-                    progress = (index + 1) / len(contacts) * 100
-                    callback(progress, results)
+                    progress = int(done * 100 / results["total"])
+                    if progress != last_progress:
+                        callback(progress, results)
+                        last_progress = progress
 
-            except Exception as e:
-                logger.error(f"Error processing contact {contact}: {str(e)}")
-                results["failed"] += 1
-                results["failures"].append({
-                    "contact": contact,
-                    "error": str(e)
-                })
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        # RATE_LIMIT workers keep up to RATE_LIMIT requests in flight
+        connector = aiohttp.TCPConnector(limit=RATE_LIMIT, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(sock_connect=3.05, sock_read=27)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout
+        ) as session:
+            await asyncio.gather(
+                *(send_worker(session) for _ in range(RATE_LIMIT))
+            )
+
+        # Duplicates skipped after the last send can shrink the total
+        if callback and results["total"] and last_progress != 100:
+            callback(100, results)
 
         logger.info(f"Bulk message sending completed. "
                    f"Success: {results['successful']}, "
                    f"Failed: {results['failed']}")
         return results
 
+    def send_bulk_messages(
+        self,
+        contacts: Union[Iterable[Dict], "pandas.DataFrame"],
+        message_template: str,
+        image_url: Optional[str] = None,
+        callback=None
+    ) -> Dict:
+        """
+        Send customized messages to multiple contacts.
+        
+        Blocking wrapper around send_bulk_messages_async for callers that
+        are not running an event loop.
+        
+        Args:
+            contacts (Iterable[Dict] or DataFrame): Contact dictionaries (a
+                list or any iterator, e.g. a stream from a CSV file), or a
+                DataFrame with one column per contact field
+            message_template (str): Message template with placeholders
+            image_url (str, optional): URL of image to send
+            callback (callable, optional): Callback function for progress updates
+            
+        Returns:
+            dict: Summary of sending operation
+        """
+        return asyncio.run(self.send_bulk_messages_async(
+            contacts,
+            message_template,
+            image_url,
+            callback
+        ))
+
     def validate_phone_number(self, phone_number: str) -> bool:
         """
         Validate phone number format.